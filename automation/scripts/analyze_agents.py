@@ -7,6 +7,7 @@ This script analyzes agent configurations and prompts to identify:
 - Complementary agents
 - Potential conflicts
 - Optimization opportunities
+- Near-duplicate instruction, prompt and skill content
 """
 
 import json
@@ -16,6 +17,7 @@ from pathlib import Path
 from typing import Dict, List
 
 import yaml
+from content_similarity import ContentSimilarityAnalyzer
 
 
 class AgentAnalyzer:
@@ -23,6 +25,7 @@ class AgentAnalyzer:
         self.repo_root = Path(repo_root)
         self.agents = []
         self.prompts = []
+        self.content_analyzer = ContentSimilarityAnalyzer(repo_root)
 
     def load_agents(self):
         """Load all agent configurations"""
@@ -125,6 +128,7 @@ class AgentAnalyzer:
 
         overlaps = self.analyze_overlaps()
         related = self.find_related_agents()
+        duplicates = self.content_analyzer.find_duplicates()
 
         report = ["# Agent Cross-Reference Analysis Report\n"]
         report.append(f"Total agents analyzed: {len(self.agents)}\n")
@@ -141,6 +145,16 @@ class AgentAnalyzer:
         for agent1, agent2, similarity in related[:10]:  # Top 10
             report.append(f"- {agent1} ↔ {agent2} (similarity: {similarity:.2f})\n")
 
+        report.append("\n## Duplicated Content\n")
+        report.append(
+            f"Documents compared: {len(self.content_analyzer.signatures)} "
+            f"(threshold: {self.content_analyzer.threshold:.2f})\n"
+        )
+        if not duplicates:
+            report.append("- No near-duplicate content found\n")
+        for doc1, doc2, similarity in duplicates:
+            report.append(f"- {doc1} ↔ {doc2} (similarity: {similarity:.2f})\n")
+
         return "".join(report)
 
 
@@ -8,6 +8,9 @@ This script calculates and updates confidence ratings for agents based on:
 - Context changes
 - Feedback scores
 
+Measured success rates and effectiveness scores from replay_examples.py
+(docs/replay-results.json) take precedence over hand-entered values.
+
 Requires Python 3.9+
 """
 
@@ -21,6 +24,27 @@ from typing import Dict
 class ConfidenceCalculator:
     def __init__(self, repo_root: str):
         self.repo_root = Path(repo_root)
+        self.replay_results: Dict[str, Dict] = {}
+
+    def load_replay_results(self, results_file: Path):
+        """Load measured effectiveness from the example replay harness"""
+        if not results_file.exists():
+            return
+
+        try:
+            with open(results_file, "r") as f:
+                results = json.load(f)
+        except Exception as e:
+            print(f"Error loading {results_file}: {e}")
+            return
+
+        # The offline fake backend only exercises the pipeline; its scores are not measurements
+        if results.get("backend") == "fake":
+            print(f"Ignoring {results_file.name}: produced by the fake backend")
+            return
+
+        self.replay_results = results.get("agents", {})
+        print(f"Loaded replay results for {len(self.replay_results)} agents")
 
     def calculate_confidence(self, metadata: Dict) -> float:
         """
@@ -44,6 +68,12 @@ class ConfidenceCalculator:
             with open(metadata_file, "r") as f:
                 metadata = json.load(f)
 
+            # Apply measured effectiveness when available
+            measured = self.replay_results.get(metadata.get("name"))
+            if measured and measured.get("measured"):
+                metadata["success_rate"] = measured["success_rate"]
+                metadata["effectiveness_score"] = measured["effectiveness_score"]
+
             # Calculate new confidence
             old_confidence = metadata.get("confidence_rating", 0)
             new_confidence = self.calculate_confidence(metadata)
@@ -113,6 +143,7 @@ class ConfidenceCalculator:
 def main():
     repo_root = os.getenv("REPO_ROOT", ".")
     calculator = ConfidenceCalculator(repo_root)
+    calculator.load_replay_results(Path(repo_root) / "docs" / "replay-results.json")
 
     # Update all confidence ratings
     calculator.process_all_agents()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Catalog Snapshot Queries
+
+This module runs filters and group-bys over the columnar snapshot written by
+export_catalog.py without reparsing agent source files. String predicates are
+evaluated once per dictionary entry and then matched against integer codes.
+
+Example:
+    snapshot = CatalogSnapshot.read(Path(".cache/catalog.snapshot"))
+    snapshot.group_by("domain", "confidence_rating", "mean")
+    low = snapshot.filter("confidence_rating", lambda v: v < 0.5)
+    snapshot.group_by("tags", rows=low)
+"""
+
+import json
+import os
+import struct
+import sys
+from array import array
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from export_catalog import MAGIC
+
+AGGREGATES = {
+    "count": len,
+    "sum": sum,
+    "mean": lambda values: sum(values) / len(values),
+    "min": min,
+    "max": max,
+}
+
+
+class CatalogSnapshot:
+    def __init__(self, rows: int, columns: Dict[str, Dict]):
+        self.rows = rows
+        self.columns = columns
+
+    @classmethod
+    def read(cls, snapshot_file: Path) -> "CatalogSnapshot":
+        """Load a snapshot file written by export_catalog.py"""
+        with open(snapshot_file, "rb") as f:
+            data = f.read()
+
+        if not data.startswith(MAGIC):
+            raise ValueError(f"Not a catalog snapshot: {snapshot_file}")
+
+        start = len(MAGIC)
+        (header_length,) = struct.unpack(">I", data[start : start + 4])
+        start += 4
+        header = json.loads(data[start : start + header_length])
+        body = memoryview(data)[start + header_length :]
+        swap = header["byteorder"] != sys.byteorder
+
+        columns = {}
+        for column, entry in header["columns"].items():
+            decoded = {"kind": entry["kind"]}
+            if "dictionary" in entry:
+                decoded["dictionary"] = entry["dictionary"]
+            for buffer_name in ("values", "validity", "offsets", "codes"):
+                if buffer_name not in entry:
+                    continue
+                spec = entry[buffer_name]
+                values = array(spec["typecode"])
+                values.frombytes(body[spec["offset"] : spec["offset"] + spec["length"]])
+                if swap:
+                    values.byteswap()
+                decoded[buffer_name] = values
+            columns[column] = decoded
+
+        return cls(header["rows"], columns)
+
+    def _column(self, name: str) -> Dict:
+        if name not in self.columns:
+            raise KeyError(f"Unknown column: {name}")
+        return self.columns[name]
+
+    def _is_valid(self, column: Dict, row: int) -> bool:
+        """Check the validity bitmap of a numeric column"""
+        return bool(column["validity"][row // 8] & (1 << (row % 8)))
+
+    def _row_keys(self, column: Dict, row: int) -> List[int]:
+        """Return the dictionary codes (or raw value) of a row in a column"""
+        if column["kind"] == "list":
+            return list(column["codes"][column["offsets"][row] : column["offsets"][row + 1]])
+        if column["kind"] == "string":
+            return [column["codes"][row]]
+        return [column["values"][row]]
+
+    def filter(self, name: str, predicate: Callable, rows: Optional[List[int]] = None) -> List[int]:
+        """Return row indices where predicate matches (any element for list columns)"""
+        column = self._column(name)
+        rows = range(self.rows) if rows is None else rows
+
+        if column["kind"] == "numeric":
+            values = column["values"]
+            return [row for row in rows if self._is_valid(column, row) and predicate(values[row])]
+
+        matching_codes = {
+            code for code, value in enumerate(column["dictionary"]) if predicate(value)
+        }
+        return [
+            row
+            for row in rows
+            if any(code in matching_codes for code in self._row_keys(column, row))
+        ]
+
+    def group_by(
+        self,
+        key: str,
+        value: Optional[str] = None,
+        agg: str = "count",
+        rows: Optional[List[int]] = None,
+    ) -> Dict:
+        """Aggregate a numeric column grouped by a key column
+
+        List key columns are exploded, so a row counts once per element.
+        Rows with a null key or value are skipped; groups with only nulls are omitted.
+        """
+        if agg not in AGGREGATES:
+            raise ValueError(f"Unknown aggregate: {agg}")
+        if value is None and agg != "count":
+            raise ValueError(f"Aggregate '{agg}' requires a value column")
+
+        key_column = self._column(key)
+        value_column = self._column(value) if value else None
+        if value_column is not None and value_column["kind"] != "numeric":
+            raise ValueError(f"Aggregate '{agg}' requires a numeric value column, got '{value}'")
+        rows = range(self.rows) if rows is None else rows
+
+        groups = defaultdict(list)
+        for row in rows:
+            if key_column["kind"] == "numeric" and not self._is_valid(key_column, row):
+                continue
+            if value_column is not None and not self._is_valid(value_column, row):
+                continue
+            for code in self._row_keys(key_column, row):
+                groups[code].append(value_column["values"][row] if value_column else 1)
+
+        dictionary = key_column.get("dictionary")
+        result = {
+            (dictionary[code] if dictionary is not None else code): AGGREGATES[agg](group)
+            for code, group in groups.items()
+        }
+        return dict(sorted(result.items(), key=lambda item: item[1], reverse=True))
+
+    def decode(self, name: str, rows: Optional[List[int]] = None) -> List:
+        """Materialize a column as Python values"""
+        column = self._column(name)
+        rows = range(self.rows) if rows is None else rows
+
+        if column["kind"] == "numeric":
+            return [column["values"][row] if self._is_valid(column, row) else None for row in rows]
+        if column["kind"] == "string":
+            return [column["dictionary"][self._row_keys(column, row)[0]] for row in rows]
+        return [
+            [column["dictionary"][code] for code in self._row_keys(column, row)] for row in rows
+        ]
+
+
+def main():
+    repo_root = os.getenv("REPO_ROOT", ".")
+    snapshot_file = Path(repo_root) / ".cache" / "catalog.snapshot"
+
+    if not snapshot_file.exists():
+        print(f"Error: snapshot not found at {snapshot_file}; run export_catalog.py first")
+        sys.exit(1)
+
+    snapshot = CatalogSnapshot.read(snapshot_file)
+    print(f"Loaded snapshot with {snapshot.rows} agents\n")
+
+    print("Mean confidence by domain:")
+    for domain, mean in snapshot.group_by("domain", "confidence_rating", "mean").items():
+        print(f"- {domain}: {mean:.2f}")
+
+    print("\nAgents per context:")
+    for context, count in snapshot.group_by("context_compatibility").items():
+        print(f"- {context}: {count}")
+
+    print("\nTags with the most low-confidence agents (< 0.5):")
+    low_confidence = snapshot.filter("confidence_rating", lambda v: v < 0.5)
+    for tag, count in snapshot.group_by("tags", rows=low_confidence).items():
+        print(f"- {tag}: {count}")
+
+
+if __name__ == "__main__":
+    main()
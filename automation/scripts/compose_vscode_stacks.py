@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+VS Code Stack Composer
+
+This script resolves stack manifests under vscode-config/stacks/ into merged
+VS Code configuration files:
+- settings.json from core, settings, platforms and hardware modules
+- extensions.json from extension modules
+- tasks.json from task modules
+- mcp.json from MCP modules
+
+Merge policy (applied in manifest order, later modules win):
+- Objects are merged recursively key by key
+- Arrays are concatenated, skipping items already present
+- Scalars and type mismatches are replaced by the later value
+
+Each module is parsed once and shared across all stacks. Builds are keyed on
+the stack's module list plus the content hash of each referenced module. The
+key is stored in build/<stack>/.build-key, so unchanged stacks are skipped on
+later runs and stacks that resolve to the same modules are composed once.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+BUILD_KEY_FILE = ".build-key"
+
+# Output file for each module category, in merge order
+OUTPUT_CATEGORIES = {
+    "settings.json": ["core", "settings", "platforms", "hardware"],
+    "extensions.json": ["extensions"],
+    "tasks.json": ["tasks"],
+    "mcp.json": ["mcp"],
+}
+
+
+def deep_merge(base: Any, override: Any) -> Any:
+    """Merge override into base following the composer merge policy"""
+    if isinstance(base, dict) and isinstance(override, dict):
+        merged = dict(base)
+        for key, value in override.items():
+            merged[key] = deep_merge(merged[key], value) if key in merged else copy.deepcopy(value)
+        return merged
+
+    if isinstance(base, list) and isinstance(override, list):
+        merged = list(base)
+        seen = {json.dumps(item, sort_keys=True) for item in base}
+        for item in override:
+            marker = json.dumps(item, sort_keys=True)
+            if marker not in seen:
+                seen.add(marker)
+                merged.append(copy.deepcopy(item))
+        return merged
+
+    return copy.deepcopy(override)
+
+
+class VSCodeStackComposer:
+    def __init__(self, config_root: Path, output_root: Optional[Path] = None):
+        self.config_root = Path(config_root)
+        self.output_root = output_root or self.config_root / "build"
+        self.errors: List[str] = []
+        self.skipped = 0
+        self._module_hashes: Dict[Path, Optional[str]] = {}
+        self._module_bytes: Dict[Path, bytes] = {}
+        self._modules: Dict[Path, Optional[Dict]] = {}
+        self._compositions: Dict[str, Dict[str, Dict]] = {}
+
+    def module_hash(self, category: str, module_file: str) -> Optional[str]:
+        """Hash a module's content once; None if it does not exist"""
+        module_path = self.config_root / category / module_file
+        if module_path not in self._module_hashes:
+            try:
+                content = module_path.read_bytes()
+                self._module_bytes[module_path] = content
+                self._module_hashes[module_path] = hashlib.sha256(content).hexdigest()
+            except FileNotFoundError:
+                self.errors.append(f"Module not found: {category}/{module_file}")
+                self._module_hashes[module_path] = None
+        return self._module_hashes[module_path]
+
+    def load_module(self, category: str, module_file: str) -> Optional[Dict]:
+        """Parse a module once and return the shared result"""
+        module_path = self.config_root / category / module_file
+        if module_path in self._modules:
+            return self._modules[module_path]
+
+        module = None
+        if self.module_hash(category, module_file) is not None:
+            try:
+                module = json.loads(self._module_bytes.pop(module_path))
+                if not isinstance(module, dict):
+                    self.errors.append(f"Module must be a JSON object: {category}/{module_file}")
+                    module = None
+            except json.JSONDecodeError as e:
+                self.errors.append(f"Invalid JSON in {category}/{module_file}: {e}")
+
+        self._modules[module_path] = module
+        return module
+
+    def resolve_modules(self, manifest_file: Path) -> Dict[str, List[str]]:
+        """Return the manifest's modules for the categories the composer uses"""
+        with open(manifest_file, "r") as f:
+            manifest = yaml.safe_load(f) or {}
+        modules = manifest.get("modules") or {}
+
+        return {
+            category: list(modules.get(category) or [])
+            for categories in OUTPUT_CATEGORIES.values()
+            for category in categories
+            if modules.get(category)
+        }
+
+    def build_key(self, modules: Dict[str, List[str]]) -> str:
+        """Key a build on its module list and the content of those modules"""
+        payload = {
+            category: [[name, self.module_hash(category, name)] for name in names]
+            for category, names in modules.items()
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def compose(self, modules: Dict[str, List[str]], key: str) -> Dict[str, Dict]:
+        """Resolve a stack's modules into merged output documents"""
+        if key in self._compositions:
+            return self._compositions[key]
+
+        outputs = {}
+        for output_name, categories in OUTPUT_CATEGORIES.items():
+            merged: Dict = {}
+            for category in categories:
+                for module_file in modules.get(category, []):
+                    module = self.load_module(category, module_file)
+                    if module is not None:
+                        merged = deep_merge(merged, module)
+            if merged:
+                outputs[output_name] = merged
+
+        self._compositions[key] = outputs
+        return outputs
+
+    def write_stack(self, manifest_file: Path) -> Optional[Path]:
+        """Compose a stack and write its output files, skipping unchanged builds"""
+        stack_dir = self.output_root / manifest_file.stem
+        key_file = stack_dir / BUILD_KEY_FILE
+
+        modules = self.resolve_modules(manifest_file)
+        key = self.build_key(modules)
+        if key_file.exists() and key_file.read_text().strip() == key:
+            self.skipped += 1
+            return stack_dir
+
+        outputs = self.compose(modules, key)
+        if not outputs:
+            if stack_dir.exists():
+                shutil.rmtree(stack_dir)
+            return None
+
+        stack_dir.mkdir(parents=True, exist_ok=True)
+        for output_name in OUTPUT_CATEGORIES:
+            output_file = stack_dir / output_name
+            if output_name not in outputs:
+                # Remove outputs the manifest no longer produces
+                if output_file.exists():
+                    output_file.unlink()
+                continue
+            rendered = json.dumps(outputs[output_name], indent=2) + "\n"
+            if output_file.exists() and output_file.read_text() == rendered:
+                continue
+            output_file.write_text(rendered)
+
+        # Only remember clean builds so errors are reported again on the next run
+        clean = all(
+            self._modules.get(self.config_root / category / name) is not None
+            for category, names in modules.items()
+            for name in names
+        )
+        if clean:
+            key_file.write_text(key + "\n")
+        elif key_file.exists():
+            key_file.unlink()
+
+        return stack_dir
+
+    def build_all(self) -> bool:
+        """Compose every stack manifest under stacks/"""
+        stacks_dir = self.config_root / "stacks"
+        if not stacks_dir.exists():
+            self.errors.append("stacks/ directory not found")
+            return False
+
+        manifest_files = sorted(list(stacks_dir.glob("*.yaml")) + list(stacks_dir.glob("*.yml")))
+
+        for manifest_file in manifest_files:
+            try:
+                stack_dir = self.write_stack(manifest_file)
+                if stack_dir is None:
+                    print(f"- {manifest_file.name}: no output, nothing to build")
+                else:
+                    print(f"✓ {manifest_file.name} → {stack_dir.relative_to(self.config_root)}")
+            except Exception as e:
+                self.errors.append(f"Error composing {manifest_file.name}: {e}")
+                print(f"✗ {manifest_file.name}: {e}")
+
+        print(
+            f"\nProcessed {len(manifest_files)} stacks from {len(self._module_hashes)} modules "
+            f"({self.skipped} unchanged, {len(self._compositions)} compositions)"
+        )
+
+        for error in self.errors:
+            print(f"  • {error}")
+
+        return len(self.errors) == 0
+
+
+def main():
+    repo_root = os.getenv("REPO_ROOT", ".")
+    config_root = Path(repo_root) / "vscode-config"
+
+    if not config_root.exists():
+        print(f"Error: vscode-config directory not found at {config_root}")
+        sys.exit(1)
+
+    composer = VSCodeStackComposer(config_root)
+    success = composer.build_all()
+
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Content Similarity Analyzer for Agent Documents
+
+This module detects near-duplicate text across the catalog:
+- Agent instructions.md and agent.md files
+- Prompt assets under prompts/
+- Skill definitions under skills/
+
+Documents are shingled into word n-grams and summarized with MinHash
+signatures. Candidate pairs are found with LSH banding, so the cost grows
+roughly linearly with the number of documents rather than quadratically.
+Signatures are cached per file content hash between runs.
+"""
+
+import hashlib
+import json
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+# Mersenne prime used for the universal hash family (a * x + b) mod p
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+WORD_RE = re.compile(r"[a-z0-9_]+")
+
+CACHE_VERSION = 1
+
+
+class ContentSimilarityAnalyzer:
+    def __init__(
+        self,
+        repo_root: str,
+        shingle_size: int = 5,
+        num_perm: int = 128,
+        bands: int = 32,
+        threshold: float = 0.5,
+        cache_file: Optional[Path] = None,
+    ):
+        if num_perm % bands != 0:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.repo_root = Path(repo_root)
+        self.shingle_size = shingle_size
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.cache_file = cache_file or self.repo_root / ".cache" / "content-signatures.json"
+        self.signatures: Dict[str, List[int]] = {}
+        self._cache: Dict[str, List[int]] = {}
+        self._cache_dirty = False
+        self._seen_hashes: Set[str] = set()
+
+        # Deterministic permutation coefficients so cached signatures stay valid
+        seed = hashlib.sha256(b"vilabs-minhash").digest()
+        self._coefficients = []
+        for i in range(num_perm):
+            digest = hashlib.sha256(seed + i.to_bytes(4, "big")).digest()
+            a = int.from_bytes(digest[:8], "big") % (MERSENNE_PRIME - 1) + 1
+            b = int.from_bytes(digest[8:16], "big") % MERSENNE_PRIME
+            self._coefficients.append((a, b))
+
+    def collect_documents(self) -> List[Path]:
+        """Collect the text documents that take part in content comparison"""
+        documents = []
+
+        agents_dir = self.repo_root / "agents"
+        if agents_dir.exists():
+            for name in ("instructions.md", "agent.md"):
+                documents.extend(agents_dir.rglob(name))
+
+        prompts_dir = self.repo_root / "prompts"
+        if prompts_dir.exists():
+            documents.extend(p for p in prompts_dir.rglob("*.md") if p.name != "README.md")
+
+        skills_dir = self.repo_root / "skills"
+        if skills_dir.exists():
+            documents.extend(skills_dir.glob("*/SKILL.md"))
+
+        return sorted(documents)
+
+    def shingle(self, text: str) -> Set[int]:
+        """Split text into hashed word n-gram shingles"""
+        words = WORD_RE.findall(text.lower())
+        if not words:
+            return set()
+
+        size = min(self.shingle_size, len(words))
+        shingles = set()
+        for i in range(len(words) - size + 1):
+            gram = " ".join(words[i : i + size]).encode("utf-8")
+            shingles.add(int.from_bytes(hashlib.blake2b(gram, digest_size=4).digest(), "big"))
+
+        return shingles
+
+    def minhash(self, shingles: Set[int]) -> List[int]:
+        """Compute the MinHash signature of a shingle set"""
+        if not shingles:
+            return [MAX_HASH] * self.num_perm
+
+        return [
+            min(((a * s + b) % MERSENNE_PRIME) & MAX_HASH for s in shingles)
+            for a, b in self._coefficients
+        ]
+
+    def load_cache(self):
+        """Load cached signatures keyed by file content hash"""
+        if not self.cache_file.exists():
+            return
+
+        try:
+            with open(self.cache_file, "r") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"Error loading {self.cache_file}: {e}")
+            return
+
+        if data.get("params") != self._cache_params():
+            return
+
+        self._cache = data.get("signatures", {})
+
+    def save_cache(self):
+        """Persist signatures of current documents so unchanged files are not rehashed"""
+        # Drop entries for content that no longer exists in the tree
+        if set(self._cache) - self._seen_hashes:
+            self._cache = {h: sig for h, sig in self._cache.items() if h in self._seen_hashes}
+            self._cache_dirty = True
+
+        if not self._cache_dirty:
+            return
+
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, "w") as f:
+                json.dump({"params": self._cache_params(), "signatures": self._cache}, f)
+            self._cache_dirty = False
+        except Exception as e:
+            print(f"Error saving {self.cache_file}: {e}")
+
+    def _cache_params(self) -> Dict:
+        return {
+            "version": CACHE_VERSION,
+            "shingle_size": self.shingle_size,
+            "num_perm": self.num_perm,
+        }
+
+    def signature_for(self, path: Path) -> List[int]:
+        """Return the signature of a file, reusing the cache when possible"""
+        content = path.read_bytes()
+        file_hash = hashlib.sha256(content).hexdigest()
+        self._seen_hashes.add(file_hash)
+
+        cached = self._cache.get(file_hash)
+        if cached is not None:
+            return cached
+
+        signature = self.minhash(self.shingle(content.decode("utf-8", errors="replace")))
+        self._cache[file_hash] = signature
+        self._cache_dirty = True
+        return signature
+
+    def compute_signatures(self):
+        """Compute signatures for all collected documents"""
+        self.load_cache()
+
+        for path in self.collect_documents():
+            key = path.relative_to(self.repo_root).as_posix()
+            try:
+                self.signatures[key] = self.signature_for(path)
+            except Exception as e:
+                print(f"Error reading {path}: {e}")
+
+        self.save_cache()
+
+    def estimate_similarity(self, sig1: List[int], sig2: List[int]) -> float:
+        """Estimate Jaccard similarity from two MinHash signatures"""
+        matches = sum(1 for i in range(self.num_perm) if sig1[i] == sig2[i])
+        return matches / self.num_perm
+
+    def candidate_pairs(self) -> Set[Tuple[str, str]]:
+        """Find candidate pairs that share at least one LSH band"""
+        candidates = set()
+
+        for band in range(self.bands):
+            start = band * self.rows
+            buckets = defaultdict(list)
+            for key, signature in self.signatures.items():
+                if signature[0] == MAX_HASH:
+                    continue  # Empty document
+                buckets[tuple(signature[start : start + self.rows])].append(key)
+
+            for keys in buckets.values():
+                if len(keys) < 2:
+                    continue
+                keys.sort()
+                for i, key1 in enumerate(keys):
+                    for key2 in keys[i + 1 :]:
+                        candidates.add((key1, key2))
+
+        return candidates
+
+    def find_duplicates(self) -> List[tuple]:
+        """Find near-duplicate document pairs above the similarity threshold"""
+        if not self.signatures:
+            self.compute_signatures()
+
+        duplicates = []
+        for doc1, doc2 in self.candidate_pairs():
+            similarity = self.estimate_similarity(self.signatures[doc1], self.signatures[doc2])
+            if similarity >= self.threshold:
+                duplicates.append((doc1, doc2, similarity))
+
+        return sorted(duplicates, key=lambda x: (-x[2], x[0], x[1]))
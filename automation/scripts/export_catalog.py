@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Columnar Catalog Snapshot Exporter
+
+This script flattens every agent's metadata.json and agent.yml into a compact
+columnar snapshot for fast aggregate queries (see catalog_query.py):
+- Numeric fields are stored as typed arrays with a validity bitmap, so
+  missing values are nulls rather than zeros
+- name and domain are dictionary-encoded string columns; agents directly
+  under agents/ (such as template-agent) get the "uncategorized" domain
+- tags, capabilities and context_compatibility are dictionary-encoded list
+  columns (offsets + codes)
+
+Snapshot layout: MAGIC, a 4-byte big-endian header length, a JSON header
+describing each column, then the raw column buffers.
+"""
+
+import json
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, List
+
+import yaml
+
+MAGIC = b"VLCATSNAP2\n"
+
+UNCATEGORIZED_DOMAIN = "uncategorized"
+
+NUMERIC_COLUMNS = {
+    "confidence_rating": "d",
+    "effectiveness_score": "d",
+    "success_rate": "d",
+    "usage_count": "q",
+}
+STRING_COLUMNS = ["name", "domain"]
+LIST_COLUMNS = ["tags", "capabilities", "context_compatibility"]
+
+
+class CatalogExporter:
+    def __init__(self, repo_root: str):
+        self.repo_root = Path(repo_root)
+        self.records: List[Dict] = []
+
+    def load_agents(self):
+        """Merge metadata.json and agent.yml into one record per agent"""
+        agents_dir = self.repo_root / "agents"
+        agent_dirs = sorted(
+            {p.parent for p in agents_dir.rglob("metadata.json")}
+            | {p.parent for p in agents_dir.rglob("agent.yml")}
+        )
+
+        for agent_dir in agent_dirs:
+            record = {}
+            sources = {}
+
+            agent_file = agent_dir / "agent.yml"
+            if agent_file.exists():
+                try:
+                    with open(agent_file, "r") as f:
+                        record.update(yaml.safe_load(f) or {})
+                    sources = dict.fromkeys(record, agent_file)
+                    self._check_lists(record, agent_file)
+                except Exception as e:
+                    print(f"Error loading {agent_file}: {e}")
+
+            metadata_file = agent_dir / "metadata.json"
+            if metadata_file.exists():
+                try:
+                    with open(metadata_file, "r") as f:
+                        metadata = json.load(f)
+                except Exception as e:
+                    print(f"Error loading {metadata_file}: {e}")
+                    metadata = {}
+                self._check_lists(metadata, metadata_file)
+
+                # Lists are unioned, everything else prefers metadata.json
+                for key, value in metadata.items():
+                    if key in LIST_COLUMNS and record.get(key) and value:
+                        record[key] = list(dict.fromkeys(record[key] + value))
+                    elif key in LIST_COLUMNS and not value:
+                        record.setdefault(key, value)
+                    else:
+                        record[key] = value
+                        sources[key] = metadata_file
+
+            # Invalid numbers become nulls instead of aborting the export
+            for column, typecode in NUMERIC_COLUMNS.items():
+                value = record.get(column)
+                if value is None:
+                    continue
+                try:
+                    record[column] = float(value) if typecode == "d" else int(value)
+                except (TypeError, ValueError) as e:
+                    print(f"Error loading {sources.get(column, agent_dir)}: invalid {column}: {e}")
+                    record[column] = None
+
+            parts = agent_dir.relative_to(agents_dir).parts
+            record.setdefault("name", agent_dir.name)
+            record["domain"] = parts[0] if len(parts) > 1 else UNCATEGORIZED_DOMAIN
+            self.records.append(record)
+
+    def _check_lists(self, data: Dict, source: Path):
+        """Drop list fields holding non-list values instead of aborting the export"""
+        for column in LIST_COLUMNS:
+            value = data.get(column)
+            if value is not None and not isinstance(value, list):
+                print(f"Error loading {source}: invalid {column}: {value!r}")
+                data[column] = None
+
+    def build_columns(self) -> Dict[str, Dict]:
+        """Encode loaded records into typed and dictionary-encoded columns"""
+        columns = {}
+
+        for column, typecode in NUMERIC_COLUMNS.items():
+            values = array(typecode)
+            validity = array("B", bytes((len(self.records) + 7) // 8))
+            for row, record in enumerate(self.records):
+                value = record.get(column)
+                if value is None:
+                    values.append(0)
+                else:
+                    values.append(value)
+                    validity[row // 8] |= 1 << (row % 8)
+            columns[column] = {"kind": "numeric", "values": values, "validity": validity}
+
+        for column in STRING_COLUMNS:
+            dictionary: Dict[str, int] = {}
+            codes = array("I")
+            for record in self.records:
+                codes.append(dictionary.setdefault(str(record.get(column, "")), len(dictionary)))
+            columns[column] = {"kind": "string", "dictionary": list(dictionary), "codes": codes}
+
+        for column in LIST_COLUMNS:
+            dictionary = {}
+            offsets = array("I", [0])
+            codes = array("I")
+            for record in self.records:
+                for item in record.get(column) or []:
+                    codes.append(dictionary.setdefault(str(item), len(dictionary)))
+                offsets.append(len(codes))
+            columns[column] = {
+                "kind": "list",
+                "dictionary": list(dictionary),
+                "offsets": offsets,
+                "codes": codes,
+            }
+
+        return columns
+
+    def write_snapshot(self, output_file: Path):
+        """Write the columnar snapshot file"""
+        columns = self.build_columns()
+        header = {"rows": len(self.records), "byteorder": sys.byteorder, "columns": {}}
+        buffers = []
+        offset = 0
+
+        for column, data in columns.items():
+            entry = {"kind": data["kind"]}
+            if "dictionary" in data:
+                entry["dictionary"] = data["dictionary"]
+
+            for buffer_name in ("values", "validity", "offsets", "codes"):
+                if buffer_name not in data:
+                    continue
+                raw = data[buffer_name].tobytes()
+                entry[buffer_name] = {
+                    "typecode": data[buffer_name].typecode,
+                    "offset": offset,
+                    "length": len(raw),
+                }
+                buffers.append(raw)
+                offset += len(raw)
+
+            header["columns"][column] = entry
+
+        header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack(">I", len(header_bytes)))
+            f.write(header_bytes)
+            for raw in buffers:
+                f.write(raw)
+
+
+def main():
+    repo_root = os.getenv("REPO_ROOT", ".")
+    exporter = CatalogExporter(repo_root)
+    exporter.load_agents()
+
+    output_file = Path(repo_root) / ".cache" / "catalog.snapshot"
+    exporter.write_snapshot(output_file)
+
+    print(f"Exported {len(exporter.records)} agents")
+    print(f"Snapshot saved to: {output_file}")
+
+
+if __name__ == "__main__":
+    main()
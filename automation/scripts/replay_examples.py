@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Example Replay Harness for Agents
+
+This script replays every agent's examples/ against a model backend to
+measure effectiveness instead of relying on hand-entered numbers:
+- Runs all examples for all agents concurrently
+- Caches responses by prompt hash between runs
+- Records pass/fail results and latency percentiles per agent
+- Writes docs/replay-results.json for ConfidenceCalculator
+
+Backends are pluggable. The default "fake" backend is deterministic and runs
+offline; the "command" backend pipes each prompt to an external command.
+Fake-backend runs only exercise the pipeline, so their results are written to
+.cache/ instead of docs/ and never replace real measurements.
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+import shlex
+import subprocess
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+SECTION_RE = re.compile(r"^## +(.+?)\s*$")
+FENCE_RE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+WORD_RE = re.compile(r"[a-z0-9_]{4,}")
+
+INPUT_SECTIONS = ("input",)
+EXPECTED_SECTIONS = ("output", "agent action")
+
+
+class ModelBackend(ABC):
+    """Base class for model backends used by the replay harness"""
+
+    name = "base"
+
+    @property
+    def cache_key(self) -> str:
+        """Identity of the backend configuration used in response cache keys"""
+        return self.name
+
+    @abstractmethod
+    def complete(self, system: str, prompt: str) -> str:
+        """Return the model response for a system and user prompt"""
+
+
+class FakeBackend(ModelBackend):
+    """Deterministic local backend that echoes the system and user prompt"""
+
+    name = "fake"
+
+    def complete(self, system: str, prompt: str) -> str:
+        return f"{system}\n\n{prompt}"
+
+
+class CommandBackend(ModelBackend):
+    """Backend that sends the prompt on stdin to an external command"""
+
+    name = "command"
+
+    def __init__(self, command: str, timeout: int = 300, model: Optional[str] = None):
+        self.command = shlex.split(command)
+        self.timeout = timeout
+        self.model = model
+
+    @property
+    def cache_key(self) -> str:
+        return json.dumps(
+            {
+                "backend": self.name,
+                "command": self.command,
+                "timeout": self.timeout,
+                "model": self.model,
+            },
+            sort_keys=True,
+        )
+
+    def complete(self, system: str, prompt: str) -> str:
+        result = subprocess.run(
+            self.command,
+            input=f"{system}\n\n{prompt}",
+            capture_output=True,
+            text=True,
+            timeout=self.timeout,
+            check=True,
+        )
+        return result.stdout
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of a list of values, or None if there are none"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def split_sections(text: str) -> Dict[str, str]:
+    """Split a markdown example into its level-2 sections
+
+    Headings inside fenced code blocks belong to the enclosing section.
+    """
+    sections: Dict[str, List[str]] = {}
+    current = None
+    fence = None
+
+    for line in text.splitlines():
+        fence_match = FENCE_RE.match(line)
+        if fence is None and fence_match:
+            fence = fence_match.group(1)
+        elif fence is not None and fence_match:
+            marker = fence_match.group(1)
+            # A closing fence uses the same character, is at least as long and has no info string
+            if (
+                marker[0] == fence[0]
+                and len(marker) >= len(fence)
+                and not line.strip()[len(marker) :]
+            ):
+                fence = None
+        elif fence is None:
+            heading = SECTION_RE.match(line)
+            if heading:
+                current = heading.group(1)
+                sections[current] = []
+                continue
+
+        if current is not None:
+            sections[current].append(line)
+
+    return {title: "\n".join(lines).strip() for title, lines in sections.items()}
+
+
+class ReplayHarness:
+    def __init__(
+        self,
+        repo_root: str,
+        backend: ModelBackend,
+        max_workers: int = 8,
+        pass_threshold: float = 0.5,
+        cache_file: Optional[Path] = None,
+    ):
+        self.repo_root = Path(repo_root)
+        self.backend = backend
+        self.max_workers = max_workers
+        self.pass_threshold = pass_threshold
+        self.cache_file = cache_file or self.repo_root / ".cache" / "replay-responses.json"
+        self._cache: Dict[str, Dict] = {}
+        self._cache_lock = threading.Lock()
+
+    def load_examples(self) -> List[Dict]:
+        """Load replayable examples for every agent with an examples/ folder"""
+        examples = []
+
+        for examples_dir in sorted((self.repo_root / "agents").rglob("examples")):
+            agent_dir = examples_dir.parent
+            agent_name = agent_dir.name
+
+            metadata_file = agent_dir / "metadata.json"
+            if metadata_file.exists():
+                try:
+                    with open(metadata_file, "r") as f:
+                        agent_name = json.load(f).get("name", agent_name)
+                except Exception as e:
+                    print(f"Error loading {metadata_file}: {e}")
+
+            instructions_file = agent_dir / "instructions.md"
+            system = instructions_file.read_text() if instructions_file.exists() else ""
+
+            for example_file in sorted(examples_dir.glob("*.md")):
+                sections = split_sections(example_file.read_text())
+                prompt = self._join_sections(sections, INPUT_SECTIONS)
+                expected = self._join_sections(sections, EXPECTED_SECTIONS)
+                if not prompt or not expected:
+                    print(f"Skipping {example_file}: missing input or output section")
+                    continue
+
+                examples.append(
+                    {
+                        "agent": agent_name,
+                        "example": example_file.relative_to(self.repo_root).as_posix(),
+                        "system": system,
+                        "prompt": prompt,
+                        "expected": expected,
+                    }
+                )
+
+        return examples
+
+    def _join_sections(self, sections: Dict[str, str], prefixes: Tuple[str, ...]) -> str:
+        return "\n\n".join(
+            body for title, body in sections.items() if title.lower().startswith(prefixes)
+        )
+
+    def load_cache(self):
+        """Load cached responses keyed by prompt hash"""
+        if not self.cache_file.exists():
+            return
+
+        try:
+            with open(self.cache_file, "r") as f:
+                self._cache = json.load(f)
+        except Exception as e:
+            print(f"Error loading {self.cache_file}: {e}")
+
+    def save_cache(self):
+        """Persist cached responses"""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, "w") as f:
+                json.dump(self._cache, f)
+        except Exception as e:
+            print(f"Error saving {self.cache_file}: {e}")
+
+    def prompt_hash(self, system: str, prompt: str) -> str:
+        """Hash a prompt together with the backend that answers it"""
+        payload = "\0".join([self.backend.cache_key, system, prompt]).encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def score(self, response: str, expected: str) -> float:
+        """Fraction of the expected output's key terms present in the response"""
+        expected_terms = set(WORD_RE.findall(expected.lower()))
+        if not expected_terms:
+            return 0.0
+        response_terms = set(WORD_RE.findall(response.lower()))
+        return len(expected_terms & response_terms) / len(expected_terms)
+
+    def run_example(self, example: Dict) -> Dict:
+        """Replay a single example, using the response cache when possible"""
+        key = self.prompt_hash(example["system"], example["prompt"])
+
+        with self._cache_lock:
+            cached = self._cache.get(key)
+        from_cache = cached is not None
+
+        if cached is None:
+            start = time.perf_counter()
+            try:
+                response = self.backend.complete(example["system"], example["prompt"])
+            except Exception as e:
+                print(f"Error replaying {example['example']}: {e}")
+                return {"agent": example["agent"], "example": example["example"], "error": str(e)}
+            latency_ms = (time.perf_counter() - start) * 1000.0
+            cached = {"response": response, "latency_ms": latency_ms}
+            with self._cache_lock:
+                self._cache[key] = cached
+
+        score = self.score(cached["response"], example["expected"])
+        return {
+            "agent": example["agent"],
+            "example": example["example"],
+            "score": round(score, 4),
+            "passed": score >= self.pass_threshold,
+            "latency_ms": cached["latency_ms"],
+            "cached": from_cache,
+        }
+
+    def run(self) -> Dict:
+        """Replay all examples concurrently and aggregate results per agent"""
+        self.load_cache()
+        examples = self.load_examples()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(self.run_example, examples))
+
+        self.save_cache()
+
+        by_agent = defaultdict(list)
+        for result in results:
+            by_agent[result["agent"]].append(result)
+
+        agents = {}
+        for agent_name, agent_results in sorted(by_agent.items()):
+            completed = [r for r in agent_results if "error" not in r]
+            errors = len(agent_results) - len(completed)
+            passed = sum(1 for r in completed if r["passed"])
+            # Cached responses carry a latency from an earlier run, so fresh calls take
+            # precedence; a fully cached run keeps the stored latencies, labelled as cached
+            fresh = [r["latency_ms"] for r in completed if not r["cached"]]
+            if fresh:
+                latencies, latency_source = fresh, "measured"
+            elif completed:
+                latencies, latency_source = [r["latency_ms"] for r in completed], "cached"
+            else:
+                latencies, latency_source = [], None
+
+            agents[agent_name] = {
+                "examples": len(agent_results),
+                "passed": passed,
+                "failed": len(completed) - passed,
+                "errors": errors,
+                "cached": sum(1 for r in completed if r["cached"]),
+                # Any backend error makes the numbers partial, so they are not used for confidence
+                "measured": bool(completed) and errors == 0,
+                "success_rate": round(passed / len(completed) * 100.0, 2) if completed else None,
+                "effectiveness_score": (
+                    round(sum(r["score"] for r in completed) / len(completed), 2)
+                    if completed
+                    else None
+                ),
+                "latency_source": latency_source,
+                "latency_ms": {
+                    name: (round(value, 2) if value is not None else None)
+                    for name, value in (
+                        ("p50", percentile(latencies, 50)),
+                        ("p90", percentile(latencies, 90)),
+                        ("p99", percentile(latencies, 99)),
+                    )
+                },
+                "results": agent_results,
+            }
+
+        return {
+            "backend": self.backend.name,
+            "generated": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "pass_threshold": self.pass_threshold,
+            "agents": agents,
+        }
+
+    def generate_report(self, results: Dict) -> str:
+        """Generate a markdown summary of replay results"""
+        report = ["# Agent Example Replay Report\n\n"]
+        report.append(f"Backend: `{results['backend']}`\n\n")
+        report.append(
+            "Latency percentiles use fresh responses; agents answered entirely from cache "
+            "report their stored latencies, marked `(cached)`.\n\n"
+        )
+        report.append(
+            "| Agent | Passed | Errors | Cached | Success Rate | Effectiveness "
+            "| p50 ms | p90 ms | p99 ms |\n"
+        )
+        report.append(
+            "|-------|--------|--------|--------|--------------|---------------"
+            "|--------|--------|--------|\n"
+        )
+
+        for agent_name, agent in results["agents"].items():
+            suffix = " (cached)" if agent["latency_source"] == "cached" else ""
+            latency = {
+                name: (f"{value:.1f}{suffix}" if value is not None else "n/a")
+                for name, value in agent["latency_ms"].items()
+            }
+            if agent["measured"]:
+                success = f"{agent['success_rate']:.1f}%"
+                effectiveness = f"{agent['effectiveness_score']:.2f}"
+            else:
+                success = effectiveness = "unmeasured"
+            report.append(
+                f"| {agent_name} | "
+                f"{agent['passed']}/{agent['examples']} | "
+                f"{agent['errors']} | "
+                f"{agent['cached']} | "
+                f"{success} | "
+                f"{effectiveness} | "
+                f"{latency['p50']} | "
+                f"{latency['p90']} | "
+                f"{latency['p99']} |\n"
+            )
+
+        return "".join(report)
+
+
+def create_backend() -> ModelBackend:
+    """Select the model backend from the environment"""
+    backend = os.getenv("REPLAY_BACKEND", "fake")
+
+    if backend == "fake":
+        return FakeBackend()
+    if backend == "command":
+        command = os.getenv("REPLAY_COMMAND")
+        if not command:
+            raise ValueError("REPLAY_COMMAND is required for the command backend")
+        return CommandBackend(command, model=os.getenv("REPLAY_MODEL"))
+
+    raise ValueError(f"Unknown replay backend: {backend}")
+
+
+def main():
+    repo_root = os.getenv("REPO_ROOT", ".")
+    max_workers = int(os.getenv("REPLAY_WORKERS", "8"))
+    harness = ReplayHarness(repo_root, create_backend(), max_workers=max_workers)
+
+    results = harness.run()
+    report = harness.generate_report(results)
+    print(report)
+
+    # Keep fake-backend runs away from the real measurements in docs/
+    if results["backend"] == FakeBackend.name:
+        output_dir = Path(repo_root) / ".cache"
+    else:
+        output_dir = Path(repo_root) / "docs"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    results_file = output_dir / "replay-results.json"
+    with open(results_file, "w") as f:
+        json.dump(results, f, indent=2)
+
+    report_file = output_dir / "replay-report.md"
+    with open(report_file, "w") as f:
+        f.write(report)
+
+    print(f"\nResults saved to: {results_file}")
+    print(f"Report saved to: {report_file}")
+
+
+if __name__ == "__main__":
+    main()
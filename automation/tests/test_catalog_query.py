@@ -0,0 +1,75 @@
+"""Tests for the columnar catalog snapshot."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "automation" / "scripts"))
+
+from catalog_query import CatalogSnapshot  # noqa: E402
+from export_catalog import UNCATEGORIZED_DOMAIN, CatalogExporter  # noqa: E402
+
+
+def _write_metadata(root: Path, relative: str, metadata: dict):
+    agent_dir = root / "agents" / relative
+    agent_dir.mkdir(parents=True)
+    (agent_dir / "metadata.json").write_text(json.dumps(metadata))
+
+
+def _snapshot(root: Path) -> CatalogSnapshot:
+    exporter = CatalogExporter(str(root))
+    exporter.load_agents()
+    snapshot_file = root / "catalog.snapshot"
+    exporter.write_snapshot(snapshot_file)
+    return CatalogSnapshot.read(snapshot_file)
+
+
+def test_missing_and_invalid_numbers_are_null(tmp_path, capsys):
+    _write_metadata(tmp_path, "core/a", {"name": "a", "confidence_rating": 0.8, "usage_count": 0})
+    _write_metadata(tmp_path, "core/b", {"name": "b"})
+    _write_metadata(tmp_path, "core/c", {"name": "c", "usage_count": "many"})
+
+    snapshot = _snapshot(tmp_path)
+
+    assert "invalid usage_count" in capsys.readouterr().out
+    assert snapshot.decode("confidence_rating") == [0.8, None, None]
+    assert snapshot.decode("usage_count") == [0, None, None]
+    assert snapshot.group_by("domain", "confidence_rating", "mean") == {"core": 0.8}
+    assert snapshot.group_by("usage_count") == {0: 1}
+    assert snapshot.filter("usage_count", lambda v: v < 10) == [0]
+
+
+def test_group_by_rejects_non_numeric_value_column(tmp_path):
+    _write_metadata(tmp_path, "core/a", {"name": "a"})
+
+    with pytest.raises(ValueError, match="numeric value column"):
+        _snapshot(tmp_path).group_by("domain", "name", "mean")
+
+
+def test_mismatched_list_fields_are_reported(tmp_path, capsys):
+    agent_dir = tmp_path / "agents" / "core" / "a"
+    agent_dir.mkdir(parents=True)
+    (agent_dir / "agent.yml").write_text("name: a\ncapabilities: [code_review]\ntags: review\n")
+    (agent_dir / "metadata.json").write_text(
+        json.dumps({"name": "a", "capabilities": "docs", "tags": ["quality"]})
+    )
+
+    snapshot = _snapshot(tmp_path)
+
+    output = capsys.readouterr().out
+    assert f"Error loading {agent_dir / 'agent.yml'}: invalid tags" in output
+    assert f"Error loading {agent_dir / 'metadata.json'}: invalid capabilities" in output
+    assert snapshot.decode("capabilities") == [["code_review"]]
+    assert snapshot.decode("tags") == [["quality"]]
+
+
+def test_top_level_agents_are_uncategorized(tmp_path):
+    _write_metadata(tmp_path, "template-agent", {"name": "template-agent"})
+    _write_metadata(tmp_path, "web/frontend", {"name": "frontend"})
+
+    snapshot = _snapshot(tmp_path)
+
+    assert snapshot.decode("domain") == [UNCATEGORIZED_DOMAIN, "web"]
@@ -0,0 +1,121 @@
+"""Tests for the VS Code stack composer."""
+
+import json
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "automation" / "scripts"))
+
+from compose_vscode_stacks import (  # noqa: E402
+    BUILD_KEY_FILE,
+    VSCodeStackComposer,
+    deep_merge,
+)
+
+
+def _write_json(path: Path, data: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data))
+
+
+def _write_stack(config_root: Path, name: str, modules: dict):
+    stack_file = config_root / "stacks" / f"{name}.yaml"
+    stack_file.parent.mkdir(parents=True, exist_ok=True)
+    lines = [f"name: {name}", f"description: {name} stack", "modules:"]
+    lines += [f"  {category}: [{', '.join(files)}]" for category, files in modules.items()]
+    stack_file.write_text("\n".join(lines) + "\n")
+
+
+def _config_root(tmp_path: Path) -> Path:
+    config_root = tmp_path / "vscode-config"
+    _write_json(
+        config_root / "core" / "base.json",
+        {"editor.tabSize": 2, "files.exclude": {"a": True}, "cSpell.words": ["vilabs"]},
+    )
+    _write_json(
+        config_root / "settings" / "python.json",
+        {"editor.tabSize": 4, "files.exclude": {"b": True}, "cSpell.words": ["vilabs", "pytest"]},
+    )
+    _write_json(config_root / "extensions" / "python.json", {"recommendations": ["ms-python"]})
+    return config_root
+
+
+def test_deep_merge_policy():
+    base = {"nested": {"a": 1, "keep": True}, "items": [1, {"x": 1}], "scalar": "old"}
+    override = {"nested": {"a": 2, "b": 3}, "items": [{"x": 1}, 2], "scalar": ["new"]}
+
+    merged = deep_merge(base, override)
+
+    assert merged == {
+        "nested": {"a": 2, "keep": True, "b": 3},
+        "items": [1, {"x": 1}, 2],
+        "scalar": ["new"],
+    }
+    assert base["nested"] == {"a": 1, "keep": True}
+
+
+def test_stacks_with_same_modules_share_composition(tmp_path):
+    config_root = _config_root(tmp_path)
+    modules = {"core": ["base.json"], "settings": ["python.json"], "extensions": ["python.json"]}
+    _write_stack(config_root, "alpha", modules)
+    _write_stack(config_root, "beta", modules)
+
+    composer = VSCodeStackComposer(config_root)
+    assert composer.build_all()
+
+    assert len(composer._compositions) == 1
+    settings = json.loads((config_root / "build" / "alpha" / "settings.json").read_text())
+    assert settings == {
+        "editor.tabSize": 4,
+        "files.exclude": {"a": True, "b": True},
+        "cSpell.words": ["vilabs", "pytest"],
+    }
+    assert (config_root / "build" / "beta" / "extensions.json").exists()
+
+
+def test_unchanged_stacks_are_skipped_on_rebuild(tmp_path):
+    config_root = _config_root(tmp_path)
+    _write_stack(config_root, "alpha", {"core": ["base.json"]})
+    VSCodeStackComposer(config_root).build_all()
+
+    rebuild = VSCodeStackComposer(config_root)
+    assert rebuild.build_all()
+    assert rebuild.skipped == 1
+    assert not rebuild._compositions
+
+    # Changing a referenced module invalidates the build key
+    _write_json(config_root / "core" / "base.json", {"editor.tabSize": 8})
+    changed = VSCodeStackComposer(config_root)
+    assert changed.build_all()
+    assert changed.skipped == 0
+    settings = json.loads((config_root / "build" / "alpha" / "settings.json").read_text())
+    assert settings == {"editor.tabSize": 8}
+
+
+def test_build_with_missing_module_is_not_recorded(tmp_path):
+    config_root = _config_root(tmp_path)
+    _write_stack(config_root, "alpha", {"core": ["base.json"], "platforms": ["missing.json"]})
+
+    composer = VSCodeStackComposer(config_root)
+    assert not composer.build_all()
+
+    stack_dir = config_root / "build" / "alpha"
+    assert (stack_dir / "settings.json").exists()
+    assert not (stack_dir / BUILD_KEY_FILE).exists()
+    assert not VSCodeStackComposer(config_root).build_all()
+
+
+def test_stale_outputs_and_empty_stacks_are_removed(tmp_path):
+    config_root = _config_root(tmp_path)
+    _write_stack(config_root, "alpha", {"core": ["base.json"], "extensions": ["python.json"]})
+    _write_stack(config_root, "empty", {})
+    VSCodeStackComposer(config_root).build_all()
+
+    assert not (config_root / "build" / "empty").exists()
+
+    _write_stack(config_root, "alpha", {"core": ["base.json"]})
+    VSCodeStackComposer(config_root).build_all()
+
+    assert not (config_root / "build" / "alpha" / "extensions.json").exists()
+    assert (config_root / "build" / "alpha" / "settings.json").exists()
@@ -0,0 +1,74 @@
+"""Tests for content near-duplicate detection."""
+
+import json
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "automation" / "scripts"))
+
+from content_similarity import ContentSimilarityAnalyzer  # noqa: E402
+
+BASE_TEXT = (
+    "Review every pull request for naming consistency, error handling, missing tests, "
+    "unsafe input validation, hardcoded credentials, slow database queries, unclear "
+    "documentation and duplicated logic. Report findings grouped by severity with a "
+    "concrete suggestion for each issue and a short summary for the author. "
+)
+
+
+def _write(root: Path, relative: str, text: str):
+    path = root / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def _cached_hashes(root: Path) -> set:
+    with open(root / ".cache" / "content-signatures.json", "r") as f:
+        return set(json.load(f)["signatures"])
+
+
+def test_find_duplicates_reports_near_duplicate_pair(tmp_path):
+    _write(tmp_path, "agents/core/review/instructions.md", BASE_TEXT * 3)
+    _write(tmp_path, "agents/core/review-copy/instructions.md", BASE_TEXT * 3 + "Be concise.")
+    _write(
+        tmp_path,
+        "prompts/templates/unrelated.md",
+        "Generate a changelog entry from merged commits grouped by feature area, "
+        "listing breaking changes first and linking each entry to its release tag.",
+    )
+
+    duplicates = ContentSimilarityAnalyzer(str(tmp_path)).find_duplicates()
+
+    assert [(doc1, doc2) for doc1, doc2, _ in duplicates] == [
+        ("agents/core/review-copy/instructions.md", "agents/core/review/instructions.md")
+    ]
+    assert duplicates[0][2] >= 0.5
+
+
+def test_cache_is_reused_and_pruned(tmp_path, monkeypatch):
+    _write(tmp_path, "agents/core/review/instructions.md", BASE_TEXT)
+    _write(tmp_path, "prompts/templates/summary.md", "Summarize the repository layout.")
+
+    ContentSimilarityAnalyzer(str(tmp_path)).compute_signatures()
+    first_hashes = _cached_hashes(tmp_path)
+    assert len(first_hashes) == 2
+
+    # A second run must not recompute any signature
+    analyzer = ContentSimilarityAnalyzer(str(tmp_path))
+
+    def fail_minhash(shingles):
+        raise AssertionError("signature recomputed despite cache")
+
+    monkeypatch.setattr(analyzer, "minhash", fail_minhash)
+    analyzer.compute_signatures()
+    assert len(analyzer.signatures) == 2
+
+    # Removed or changed content drops out of the cache
+    (tmp_path / "prompts" / "templates" / "summary.md").unlink()
+    _write(tmp_path, "agents/core/review/instructions.md", BASE_TEXT + "Updated.")
+    ContentSimilarityAnalyzer(str(tmp_path)).compute_signatures()
+
+    second_hashes = _cached_hashes(tmp_path)
+    assert len(second_hashes) == 1
+    assert not second_hashes & first_hashes
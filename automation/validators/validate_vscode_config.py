@@ -27,6 +27,8 @@ class VSCodeConfigValidator:
         self.errors: List[str] = []
         self.warnings: List[str] = []
         self.valid_categories = ['core', 'settings', 'extensions', 'tasks', 'platforms', 'hardware', 'mcp']
+        self.manifests: Dict[str, Dict] = {}
+        self._existing_modules: Dict[Path, bool] = {}
     
     def validate(self) -> bool:
         """Run all validations."""
@@ -70,6 +72,10 @@ class VSCodeConfigValidator:
         
         json_files = list(self.config_root.rglob('*.json'))
         json_files = [f for f in json_files if not f.name.startswith('.')]
+        # Skip generated stack output from compose_vscode_stacks.py
+        json_files = [
+            f for f in json_files if f.relative_to(self.config_root).parts[0] != 'build'
+        ]
         
         for json_file in json_files:
             try:
@@ -101,6 +107,8 @@ class VSCodeConfigValidator:
                 with open(yaml_file, 'r') as f:
                     manifest = yaml.safe_load(f)
                 
+                self.manifests[yaml_file.name] = manifest
+                
                 # Validate manifest structure
                 if 'name' not in manifest:
                     self.warnings.append(f"{yaml_file.name}: Missing 'name' field")
@@ -126,22 +134,12 @@ class VSCodeConfigValidator:
         """Validate that modules referenced in manifests exist."""
         print("🔗 Validating module references...")
         
-        stacks_dir = self.config_root / 'stacks'
-        if not stacks_dir.exists():
-            return
-        
-        yaml_files = list(stacks_dir.glob('*.yaml'))
-        yaml_files.extend(list(stacks_dir.glob('*.yml')))
-        
-        for yaml_file in yaml_files:
+        for manifest_name, manifest in self.manifests.items():
             try:
-                with open(yaml_file, 'r') as f:
-                    manifest = yaml.safe_load(f)
-                
                 if 'modules' not in manifest:
                     continue
                 
-                print(f"\n  Checking {yaml_file.name}:")
+                print(f"\n  Checking {manifest_name}:")
                 
                 for category, modules in manifest['modules'].items():
                     if category not in self.valid_categories:
@@ -152,19 +150,25 @@ class VSCodeConfigValidator:
                     for module_file in modules:
                         module_path = category_path / module_file
                         
-                        if not module_path.exists():
+                        if not self._module_exists(module_path):
                             self.errors.append(
-                                f"{yaml_file.name}: Module not found: {category}/{module_file}"
+                                f"{manifest_name}: Module not found: {category}/{module_file}"
                             )
                             print(f"    ✗ {category}/{module_file} - NOT FOUND")
                         else:
                             print(f"    ✓ {category}/{module_file}")
             
             except Exception as e:
-                self.errors.append(f"Error validating {yaml_file.name}: {e}")
+                self.errors.append(f"Error validating {manifest_name}: {e}")
         
         print()
     
+    def _module_exists(self, module_path: Path) -> bool:
+        """Check module existence once, shared across all manifests."""
+        if module_path not in self._existing_modules:
+            self._existing_modules[module_path] = module_path.exists()
+        return self._existing_modules[module_path]
+    
     def _print_results(self):
         """Print validation results."""
         print("\n" + "="*60)